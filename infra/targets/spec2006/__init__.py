@@ -4,7 +4,6 @@ import logging
 import argparse
 import getpass
 import re
-from contextlib import redirect_stdout
 from collections import defaultdict
 from typing import List
 from ...commands.report import outfile_path
@@ -16,6 +15,36 @@ from .benchmark_sets import benchmark_sets
 from .nodes_command import SpecFindBadPrunNodesCommand
 
 
+_CONFIG_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# default per-benchmark flags for 64-bit Linux (hardcoded for now), these are
+# extended with ctx.benchmark_flags when generating a config file
+_BENCHMARK_FLAGS = {
+    '400.perlbench=default=default=default': {
+        'CPORTABILITY': ['-DSPEC_CPU_LINUX']
+    },
+    '403.gcc=default=default=default': {
+        'CPORTABILITY': ['-DSPEC_CPU_LINUX']
+    },
+    '462.libquantum=default=default=default': {
+        'CPORTABILITY': ['-DSPEC_CPU_LINUX']
+    },
+    '464.h264ref=default=default=default': {
+        'CPORTABILITY': ['-fsigned-char']
+    },
+    '482.sphinx3=default=default=default': {
+        'CPORTABILITY': ['-fsigned-char']
+    },
+    '483.xalancbmk=default=default=default': {
+        'CXXPORTABILITY': ['-DSPEC_CPU_LINUX']
+    },
+    '481.wrf=default=default=default': {
+        'extra_lines': ['wrf_data_header_size = 8'],
+        'CPORTABILITY': ['-DSPEC_CPU_CASE_FLAG', '-DSPEC_CPU_LINUX']
+    }
+}
+
+
 class SPEC2006(Target):
     """
     The `SPEC-CPU2006 <https://www.spec.org/cpu2006/>`_ benchmarking suite.
@@ -50,8 +79,6 @@ class SPEC2006(Target):
 
     - ``--benchmarks``: alias for ``--spec2006-benchmarks``
     - ``--test``: run the test workload
-    - ``--measuremem``: use an alternative runscript that bypasses ``runspec``
-      to measure memory usage
     - ``--runspec-args``: passed directly to ``runspec``
 
     Parallel builds and runs using the ``--parallel`` option are supported.
@@ -189,29 +216,28 @@ class SPEC2006(Target):
         yield RusageCounters()
 
     def is_fetched(self, ctx):
-        return self.source_type == 'installed' or os.path.exists('install/shrc')
+        return self.source_type == 'installed' or \
+               os.path.exists(self.path(ctx, 'install', 'shrc'))
 
     def fetch(self, ctx):
         def do_install(srcdir):
-            os.chdir(srcdir)
             for toolset in self.toolsets:
-                ctx.log.debug('extracting SPEC-CPU2006 toolset ' + toolset)
-                run(ctx, ['tar', 'xf', toolset])
+                ctx.log.debug('extracting SPEC-CPU2006 toolset %s', toolset)
+                run(ctx, ['tar', 'xf', toolset], cwd=srcdir)
             install_path = self._install_path(ctx)
-            ctx.log.debug('installing SPEC-CPU2006 into ' + install_path)
+            ctx.log.debug('installing SPEC-CPU2006 into %s', install_path)
             run(ctx, ['./install.sh', '-f', '-d', install_path],
-                env={'PERL_TEST_NUMCONVERTS': 1})
+                env={'PERL_TEST_NUMCONVERTS': 1}, cwd=srcdir)
 
         if self.source_type == 'isofile':
             require_program(ctx, 'fuseiso', 'required to mount SPEC iso')
             require_program(ctx, 'fusermount', 'required to mount SPEC iso')
             mountdir = self.path(ctx, 'mount')
-            ctx.log.debug('mounting SPEC-CPU2006 ISO to ' + mountdir)
+            ctx.log.debug('mounting SPEC-CPU2006 ISO to %s', mountdir)
             os.mkdir(mountdir)
             run(ctx, ['fuseiso', self.source, mountdir])
             do_install(mountdir)
             ctx.log.debug('unmounting SPEC-CPU2006 ISO')
-            os.chdir(self.path(ctx))
             run(ctx, ['fusermount', '-u', mountdir])
             os.rmdir(mountdir)
 
@@ -220,24 +246,25 @@ class SPEC2006(Target):
 
         elif self.source_type == 'tarfile':
             ctx.log.debug('extracting SPEC-CPU2006 source files')
-            run(ctx, ['tar', 'xf', self.source])
-            srcdir = re.sub(r'(\.tar\.gz|\.tgz)$', '', os.path.basename(self.source))
-            if not os.path.exists(srcdir):
+            run(ctx, ['tar', 'xf', self.source], cwd=self.path(ctx))
+            basename = re.sub(r'(\.tar\.gz|\.tgz)$', '', os.path.basename(self.source))
+            if not os.path.exists(self.path(ctx, basename)):
                 raise FatalError('extracted SPEC tarfile in %s, could not find '
-                                 '%s/ afterwards' % (os.getcwd(), srcdir))
-            shutil.move(srcdir, 'src')
-            do_install('src')
+                                 '%s/ afterwards' % (self.path(ctx), basename))
+            srcdir = self.path(ctx, 'src')
+            shutil.move(self.path(ctx, basename), srcdir)
+            do_install(srcdir)
             ctx.log.debug('removing SPEC-CPU2006 source files to save disk space')
             # make removed files writable to avoid permission errors
-            srcdir = self.path(ctx, 'src')
             run(ctx, ['chmod', '-R', 'u+w', srcdir])
-            shutil.rmtree(srcdir)
+            run(ctx, ['rm', '-rf', srcdir])
 
         elif self.source_type == 'git':
             require_program(ctx, 'git')
             ctx.log.debug('cloning SPEC-CPU2006 repo')
-            run(ctx, ['git', 'clone', '--depth', 1, self.source, 'src'])
-            do_install('src')
+            srcdir = self.path(ctx, 'src')
+            run(ctx, ['git', 'clone', '--depth', 1, self.source, srcdir])
+            do_install(srcdir)
 
     def _install_path(self, ctx, *args):
         if self.source_type == 'installed':
@@ -245,14 +272,14 @@ class SPEC2006(Target):
         return self.path(ctx, 'install', *args)
 
     def _apply_patches(self, ctx):
-        os.chdir(self._install_path(ctx))
-        config_root = os.path.dirname(os.path.abspath(__file__))
+        install_path = self._install_path(ctx)
         for path in self.patches:
             if '/' not in path:
-                path = '%s/%s.patch' % (config_root, path)
-            if apply_patch(ctx, path, 1) and self.source_type == 'installed':
+                path = '%s/%s.patch' % (_CONFIG_ROOT, path)
+            if apply_patch(ctx, path, 1, cwd=install_path) and \
+                    self.source_type == 'installed':
                 ctx.log.warning('applied patch %s to external SPEC-CPU2006 '
-                                'directory' % path)
+                                'directory', path)
 
     def build(self, ctx, instance, pool=None):
         # apply any pending patches (doing this at build time allows adding
@@ -263,31 +290,37 @@ class SPEC2006(Target):
         # add flags to compile with runtime support for benchmark utils
         RusageCounters().configure(ctx)
 
-        os.chdir(self.path(ctx))
         config = self._make_spec_config(ctx, instance)
         print_output = ctx.loglevel == logging.DEBUG
 
-        for bench in self._get_benchmarks(ctx, instance):
-            cmd = 'killwrap_tree runspec --config=%s --action=build %s' % \
-                  (config, bench)
-            if pool:
+        benchmarks = self._get_benchmarks(ctx, instance)
+        if not benchmarks:
+            return
+
+        runspec_args = ['--config=' + config, '--action=build']
+
+        if pool:
+            cmd = 'killwrap_tree runspec %s {bench}' % qjoin(runspec_args)
+            outdir = os.path.join(ctx.paths.pool_results, 'build',
+                                  self.name, instance.name)
+            os.makedirs(outdir, exist_ok=True)
+            for bench in benchmarks:
                 jobid = 'build-%s-%s' % (instance.name, bench)
-                outdir = os.path.join(ctx.paths.pool_results, 'build',
-                                      self.name, instance.name)
-                os.makedirs(outdir, exist_ok=True)
                 outfile = os.path.join(outdir, bench)
-                self._run_bash(ctx, cmd, pool, jobid=jobid,
-                              outfile=outfile, nnodes=1)
-            else:
-                ctx.log.info('building %s-%s %s' %
-                             (self.name, instance.name, bench))
-                self._run_bash(ctx, cmd, teeout=print_output)
+                self._run_bash(ctx, cmd.format(bench=bench), pool,
+                               jobid=jobid, outfile=outfile, nnodes=1)
+        else:
+            # a single runspec invocation builds all benchmarks in sequence,
+            # which avoids starting the runspec driver once per benchmark
+            ctx.log.info('building %s-%s %s', self.name, instance.name,
+                         ' '.join(benchmarks))
+            self._runspec(ctx, runspec_args + benchmarks,
+                          teeout=print_output)
 
     def run(self, ctx, instance, pool=None):
-        config = 'infra-' + instance.name
-        config_root = os.path.dirname(os.path.abspath(__file__))
+        config = self._config_name(instance)
 
-        if not os.path.exists(self._install_path(ctx, 'config', config + '.cfg')):
+        if not os.path.exists(self._config_path(ctx, instance)):
             raise FatalError('%s-%s has not been built yet!' %
                              (self.name, instance.name))
 
@@ -318,20 +351,20 @@ class SPEC2006(Target):
             runargs += ['--ignore_errors']
 
         runargs += ctx.args.runspec_args
-        runargs = qjoin(runargs)
 
-        wrapper =  'killwrap_tree'
+        wrapper = []
         if self.nothp:
-            wrapper += ' nothp'
+            wrapper += ['nothp']
         if self.force_cpu >= 0:
-            wrapper += ' taskset -c %d' % self.force_cpu
-
-        cmd = '{wrapper} runspec --config={config} --nobuild {runargs} {{bench}}'
-        cmd = cmd.format(**locals())
+            wrapper += ['taskset', '-c', '%d' % self.force_cpu]
 
+        runspec_args = ['--config=' + config, '--nobuild'] + runargs
         benchmarks = self._get_benchmarks(ctx, instance)
 
         if pool:
+            cmd = 'killwrap_tree %s {bench}' % \
+                  qjoin(wrapper + ['runspec'] + runspec_args)
+
             if isinstance(pool, PrunPool):
                 # prepare output dir on local disk before running,
                 # and move output files to network disk after completion
@@ -412,11 +445,12 @@ class SPEC2006(Target):
                 self._run_bash(ctx, cmd.format(bench=bench), pool, jobid=jobid,
                                outfile=outfile, nnodes=ctx.args.iterations)
         else:
-            self._run_bash(ctx, cmd.format(bench=qjoin(benchmarks)),
-                           teeout=True)
+            self._runspec(ctx, runspec_args + benchmarks, wrapper,
+                          teeout=True)
 
-    def _run_bash(self, ctx, command, pool=None, **kwargs):
-        config_root = os.path.dirname(os.path.abspath(__file__))
+    def _run_bash(self, ctx, command, pool, **kwargs):
+        # pool jobs may run on other nodes, so they set up the SPEC
+        # environment themselves
         cmd = [
             'bash', '-c',
             '\n' + _unindent('''
@@ -424,126 +458,141 @@ class SPEC2006(Target):
             source shrc
             source "%s/scripts/kill-tree-on-interrupt.inc"
             %s
-            ''' % (self._install_path(ctx), config_root, command))
+            ''' % (self._install_path(ctx), _CONFIG_ROOT, command))
         ]
-        runfn = pool.run if pool else run
-        return runfn(ctx, cmd, **kwargs)
+        return pool.run(ctx, cmd, **kwargs)
+
+    def _runspec(self, ctx, args, wrapper=(), **kwargs):
+        # killwrap_tree is a bash function, so a shell is still needed, but the
+        # command is passed as positional arguments to avoid quoting it
+        script = 'source shrc; ' \
+                 'source "%s/scripts/kill-tree-on-interrupt.inc"; ' \
+                 'killwrap_tree "$@"' % _CONFIG_ROOT
+        cmd = ['bash', '-c', script, 'bash', *wrapper, 'runspec', *args]
+        return run(ctx, cmd, cwd=self._install_path(ctx), **kwargs)
+
+    @staticmethod
+    def _config_name(instance):
+        return 'infra-' + instance.name
+
+    def _config_path(self, ctx, instance):
+        return self._install_path(ctx, 'config',
+                                  self._config_name(instance) + '.cfg')
 
     def _make_spec_config(self, ctx, instance):
-        config_name = 'infra-' + instance.name
-        config_path = self._install_path(ctx, 'config/%s.cfg' % config_name)
-        ctx.log.debug('writing SPEC2006 config to ' + config_path)
-
-        with open(config_path, 'w') as f:
-            with redirect_stdout(f):
-                print('tune        = base')
-                print('ext         = ' + config_name)
-                print('reportable  = no')
-                print('teeout      = yes')
-                print('teerunout   = no')
-                print('makeflags   = -j%d' % ctx.jobs)
-                print('strict_rundir_verify = no')
-
-                # allow different output root to be set using
-                # --define output_root=...
-                print('%ifdef %{output_root}')
-                print('  output_root = %{output_root}')
-                print('%endif')
-
-                print('')
-                print('default=default=default=default:')
-
-                # see https://www.spec.org/cpu2006/Docs/makevars.html#nofbno1
-                # for flags ordering
-                cflags = qjoin(ctx.cflags)
-                cxxflags = qjoin(ctx.cxxflags)
-                ldflags = qjoin(ctx.ldflags)
-                extra_libs = qjoin(ctx.extra_libs) if 'extra_libs' in ctx else None
-                coptimize = qjoin(ctx.coptimize) if 'coptimize' in ctx else '-std=gnu89'
-                cxxoptimize = qjoin(ctx.cxxoptimize) if 'cxxoptimize' in ctx else '-std=c++98'
-                foptimize = qjoin(ctx.foptimize) if 'foptimize' in ctx else None
-                f77optimize = qjoin(ctx.f77optimize) if 'f77optimize' in ctx else None
-                fortranc = shutil.which('gfortran') or shutil.which('false')
-                print('CC          = %s %s' % (ctx.cc, cflags))
-                print('CXX         = %s %s' % (ctx.cxx, cxxflags))
-                print('FC          = %s' % fortranc)
-                print('CLD         = %s %s' % (ctx.cc, ldflags))
-                print('CXXLD       = %s %s' % (ctx.cxx, ldflags))
-                print('COPTIMIZE   = %s' % (coptimize))
-                print('CXXOPTIMIZE = %s' % (cxxoptimize))
-                if foptimize:
-                    print('FOPTIMIZE   = %s' % (foptimize))
-                if f77optimize:
-                    print('F77OPTIMIZE = %s' % (f77optimize))
-                if extra_libs:
-                    print('EXTRA_LIBS = %s' % (extra_libs))
-
-                # post-build hooks call back into the setup script
-                if ctx.hooks.post_build:
-                    print('')
-                    print('build_post_bench = %s exec-hook post-build %s '
-                          '`echo ${commandexe} '
-                          '| sed "s/_\\[a-z0-9\\]\\\\+\\\\.%s\\\\\\$//"`' %
-                          (ctx.paths.setup, instance.name, config_name))
-                    print('')
-
-                # allow run wrapper to be set using --define run_wrapper=...
-                print('%ifdef %{run_wrapper}')
-                print('  monitor_wrapper = %{run_wrapper} $command')
-                print('%endif')
-
-                # configure benchmarks for 64-bit Linux (hardcoded for now)
-                print('')
-                print('default=base=default=default:')
-                print('PORTABILITY    = -DSPEC_CPU_LP64')
-                print('')
-
-                benchmark_flags = {
-                        '400.perlbench=default=default=default': {
-                            'CPORTABILITY': ['-DSPEC_CPU_LINUX_X64'] if 'arch' in ctx and ctx.arch == 'x86_64' else ['-DSPEC_CPU_LINUX']
-                        },
-                        '403.gcc=default=default=default': {
-                            'CPORTABILITY': ['-DSPEC_CPU_LINUX']
-                        },
-                        '462.libquantum=default=default=default': {
-                            'CPORTABILITY': ['-DSPEC_CPU_LINUX']
-                        },
-                        '464.h264ref=default=default=default': {
-                            'CPORTABILITY': ['-fsigned-char']
-                        },
-                        '482.sphinx3=default=default=default': {
-                            'CPORTABILITY': ['-fsigned-char']
-                        },
-                        '482.sphinx3=default=default=default': {
-                            'CPORTABILITY': ['-fsigned-char']
-                        },
-                        '483.xalancbmk=default=default=default': {
-                            'CXXPORTABILITY': ['-DSPEC_CPU_LINUX']
-                        },
-                        '481.wrf=default=default=default': {
-                            'extra_lines': ['wrf_data_header_size = 8'],
-                            'CPORTABILITY': ['-DSPEC_CPU_CASE_FLAG', '-DSPEC_CPU_LINUX']
-                        }
-                }
+        config_name = self._config_name(instance)
+        config_path = self._config_path(ctx, instance)
+
+        lines = [
+            'tune        = base',
+            'ext         = ' + config_name,
+            'reportable  = no',
+            'teeout      = yes',
+            'teerunout   = no',
+            'makeflags   = -j%d' % ctx.jobs,
+            'strict_rundir_verify = no',
+
+            # allow different output root to be set using
+            # --define output_root=...
+            '%ifdef %{output_root}',
+            '  output_root = %{output_root}',
+            '%endif',
+
+            '',
+            'default=default=default=default:',
+        ]
 
-                if 'benchmark_flags' in ctx:
-                    for benchmark, flags in ctx.benchmark_flags.items():
-                        if benchmark not in benchmark_flags:
-                            benchmark_flags[benchmark] = {}
-                        for flag, value in flags.items():
-                            if flag not in benchmark_flags[benchmark]:
-                                benchmark_flags[benchmark][flag] = []
-                            benchmark_flags[benchmark][flag].extend(value)
-
-                for benchmark, flags in benchmark_flags.items():
-                    print('%s:' % benchmark)
-                    for flag, value in flags.items():
-                        if flag == 'extra_lines':
-                            for line in value:
-                                print(line)
-                        else:
-                            print('%s   = %s' % (flag, qjoin(value)))
-                    print('')
+        # see https://www.spec.org/cpu2006/Docs/makevars.html#nofbno1
+        # for flags ordering
+        cflags = qjoin(ctx.cflags)
+        cxxflags = qjoin(ctx.cxxflags)
+        ldflags = qjoin(ctx.ldflags)
+        extra_libs = qjoin(ctx.extra_libs) if 'extra_libs' in ctx else None
+        coptimize = qjoin(ctx.coptimize) if 'coptimize' in ctx else '-std=gnu89'
+        cxxoptimize = qjoin(ctx.cxxoptimize) if 'cxxoptimize' in ctx else '-std=c++98'
+        foptimize = qjoin(ctx.foptimize) if 'foptimize' in ctx else None
+        f77optimize = qjoin(ctx.f77optimize) if 'f77optimize' in ctx else None
+        fortranc = shutil.which('gfortran') or shutil.which('false')
+        lines.append('CC          = %s %s' % (ctx.cc, cflags))
+        lines.append('CXX         = %s %s' % (ctx.cxx, cxxflags))
+        lines.append('FC          = %s' % fortranc)
+        lines.append('CLD         = %s %s' % (ctx.cc, ldflags))
+        lines.append('CXXLD       = %s %s' % (ctx.cxx, ldflags))
+        lines.append('COPTIMIZE   = %s' % (coptimize))
+        lines.append('CXXOPTIMIZE = %s' % (cxxoptimize))
+        if foptimize:
+            lines.append('FOPTIMIZE   = %s' % (foptimize))
+        if f77optimize:
+            lines.append('F77OPTIMIZE = %s' % (f77optimize))
+        if extra_libs:
+            lines.append('EXTRA_LIBS = %s' % (extra_libs))
+
+        # post-build hooks call back into the setup script
+        if ctx.hooks.post_build:
+            lines.append('')
+            lines.append('build_post_bench = %s exec-hook post-build %s '
+                         '`echo ${commandexe} '
+                         '| sed "s/_\\[a-z0-9\\]\\\\+\\\\.%s\\\\\\$//"`' %
+                         (ctx.paths.setup, instance.name, config_name))
+            lines.append('')
+
+        # allow run wrapper to be set using --define run_wrapper=...
+        lines.append('%ifdef %{run_wrapper}')
+        lines.append('  monitor_wrapper = %{run_wrapper} $command')
+        lines.append('%endif')
+
+        # configure benchmarks for 64-bit Linux (hardcoded for now)
+        lines.append('')
+        lines.append('default=base=default=default:')
+        lines.append('PORTABILITY    = -DSPEC_CPU_LP64')
+        lines.append('')
+
+        # copy the defaults since they are extended with instance flags below
+        benchmark_flags = {benchmark: {flag: list(value)
+                                       for flag, value in flags.items()}
+                           for benchmark, flags in _BENCHMARK_FLAGS.items()}
+        if 'arch' in ctx and ctx.arch == 'x86_64':
+            perlbench = benchmark_flags['400.perlbench=default=default=default']
+            perlbench['CPORTABILITY'] = ['-DSPEC_CPU_LINUX_X64']
+
+        if 'benchmark_flags' in ctx:
+            for benchmark, flags in ctx.benchmark_flags.items():
+                if benchmark not in benchmark_flags:
+                    benchmark_flags[benchmark] = {}
+                for flag, value in flags.items():
+                    if flag not in benchmark_flags[benchmark]:
+                        benchmark_flags[benchmark][flag] = []
+                    benchmark_flags[benchmark][flag].extend(value)
+
+        for benchmark, flags in benchmark_flags.items():
+            lines.append('%s:' % benchmark)
+            for flag, value in flags.items():
+                if flag == 'extra_lines':
+                    for line in value:
+                        lines.append(line)
+                else:
+                    lines.append('%s   = %s' % (flag, qjoin(value)))
+            lines.append('')
+
+        # runspec appends an __MD5__ section with build checksums to the config
+        # file after building, don't overwrite the file (and thus discard the
+        # checksums, causing a full rebuild) if the part above it is unchanged
+        contents = '\n'.join(lines) + '\n'
+        try:
+            with open(config_path) as f:
+                old_contents = f.read()
+            old_contents = re.split(r'^__MD5__$', old_contents, maxsplit=1,
+                                    flags=re.M)[0]
+        except FileNotFoundError:
+            old_contents = None
+
+        if old_contents is not None and \
+                old_contents.rstrip('\n') == contents.rstrip('\n'):
+            ctx.log.debug('SPEC2006 config %s is up to date', config_path)
+        else:
+            ctx.log.debug('writing SPEC2006 config to %s', config_path)
+            with open(config_path, 'w') as f:
+                f.write(contents)
 
         return config_name
 
@@ -554,12 +603,10 @@ class SPEC2006(Target):
         pass
 
     def _get_benchmarks(self, ctx, instance):
-        benchmarks = set()
-        for bset in ctx.args.benchmarks:
-            for bench in self.benchmarks[bset]:
-                if not hasattr(instance, 'exclude_spec2006_benchmark') or \
-                        not instance.exclude_spec2006_benchmark(bench):
-                    benchmarks.add(bench)
+        exclude = getattr(instance, 'exclude_spec2006_benchmark', None)
+        benchmarks = {bench for bset in ctx.args.benchmarks
+                      for bench in self.benchmarks[bset]
+                      if exclude is None or not exclude(bench)}
         return sorted(benchmarks)
 
     # define benchmark sets, generated using scripts/parse-benchmarks-sets.py
@@ -581,7 +628,7 @@ class SPEC2006(Target):
                 yield logpath
 
         def parse_logfile(logpath):
-            ctx.log.debug('parsing log file ' + logpath)
+            ctx.log.debug('parsing log file %s', logpath)
 
             with open(logpath) as f:
                 logcontents = f.read()
@@ -610,7 +657,7 @@ class SPEC2006(Target):
                     path = os.path.join(fix_specpath(rundir), errfile)
                     if not os.path.exists(path):
                         ctx.log.error('missing errfile %s, there was probably '
-                                      'an error' % path)
+                                      'an error', path)
                         benchmark_error = True
                         continue
 
@@ -618,7 +665,7 @@ class SPEC2006(Target):
                         list(RusageCounters.parse_results(ctx, path))
                     if not rusage_results:
                         ctx.log.error('no staticlib results in %s, there was '
-                                      'probably an error' % path)
+                                      'probably an error', path)
                         benchmark_error = True
                         continue
 
@@ -628,7 +675,7 @@ class SPEC2006(Target):
 
                 if benchmark_error:
                     ctx.log.warning('cancel processing benchmark %s in log file '
-                                    '%s because of errors' % (benchmark, logpath))
+                                    '%s because of errors', benchmark, logpath)
                 else:
                     yield {
                         'benchmark': benchmark,
@@ -1,35 +1,35 @@
 # this file has been generated by parse-benchmark-sets.py
 benchmark_sets = \
-{'400.perlbench': ['400.perlbench'],
- '401.bzip2': ['401.bzip2'],
- '403.gcc': ['403.gcc'],
- '410.bwaves': ['410.bwaves'],
- '416.gamess': ['416.gamess'],
- '429.mcf': ['429.mcf'],
- '433.milc': ['433.milc'],
- '434.zeusmp': ['434.zeusmp'],
- '435.gromacs': ['435.gromacs'],
- '436.cactusADM': ['436.cactusADM'],
- '437.leslie3d': ['437.leslie3d'],
- '444.namd': ['444.namd'],
- '445.gobmk': ['445.gobmk'],
- '447.dealII': ['447.dealII'],
- '450.soplex': ['450.soplex'],
- '453.povray': ['453.povray'],
- '454.calculix': ['454.calculix'],
- '456.hmmer': ['456.hmmer'],
- '458.sjeng': ['458.sjeng'],
- '459.GemsFDTD': ['459.GemsFDTD'],
- '462.libquantum': ['462.libquantum'],
- '464.h264ref': ['464.h264ref'],
- '465.tonto': ['465.tonto'],
- '470.lbm': ['470.lbm'],
- '471.omnetpp': ['471.omnetpp'],
- '473.astar': ['473.astar'],
- '481.wrf': ['481.wrf'],
- '482.sphinx3': ['482.sphinx3'],
- '483.xalancbmk': ['483.xalancbmk'],
- 'all': ['400.perlbench',
+{'400.perlbench': ('400.perlbench',),
+ '401.bzip2': ('401.bzip2',),
+ '403.gcc': ('403.gcc',),
+ '410.bwaves': ('410.bwaves',),
+ '416.gamess': ('416.gamess',),
+ '429.mcf': ('429.mcf',),
+ '433.milc': ('433.milc',),
+ '434.zeusmp': ('434.zeusmp',),
+ '435.gromacs': ('435.gromacs',),
+ '436.cactusADM': ('436.cactusADM',),
+ '437.leslie3d': ('437.leslie3d',),
+ '444.namd': ('444.namd',),
+ '445.gobmk': ('445.gobmk',),
+ '447.dealII': ('447.dealII',),
+ '450.soplex': ('450.soplex',),
+ '453.povray': ('453.povray',),
+ '454.calculix': ('454.calculix',),
+ '456.hmmer': ('456.hmmer',),
+ '458.sjeng': ('458.sjeng',),
+ '459.GemsFDTD': ('459.GemsFDTD',),
+ '462.libquantum': ('462.libquantum',),
+ '464.h264ref': ('464.h264ref',),
+ '465.tonto': ('465.tonto',),
+ '470.lbm': ('470.lbm',),
+ '471.omnetpp': ('471.omnetpp',),
+ '473.astar': ('473.astar',),
+ '481.wrf': ('481.wrf',),
+ '482.sphinx3': ('482.sphinx3',),
+ '483.xalancbmk': ('483.xalancbmk',),
+ 'all': ('400.perlbench',
          '401.bzip2',
          '403.gcc',
          '410.bwaves',
@@ -57,8 +57,8 @@ benchmark_sets = \
          '473.astar',
          '481.wrf',
          '482.sphinx3',
-         '483.xalancbmk'],
- 'all_c': ['400.perlbench',
+         '483.xalancbmk'),
+ 'all_c': ('400.perlbench',
            '401.bzip2',
            '403.gcc',
            '429.mcf',
@@ -69,22 +69,22 @@ benchmark_sets = \
            '462.libquantum',
            '464.h264ref',
            '470.lbm',
-           '482.sphinx3'],
- 'all_cpp': ['444.namd',
+           '482.sphinx3'),
+ 'all_cpp': ('444.namd',
              '447.dealII',
              '450.soplex',
              '453.povray',
              '471.omnetpp',
              '473.astar',
-             '483.xalancbmk'],
- 'all_fortran': ['410.bwaves',
+             '483.xalancbmk'),
+ 'all_fortran': ('410.bwaves',
                  '416.gamess',
                  '434.zeusmp',
                  '437.leslie3d',
                  '459.GemsFDTD',
-                 '465.tonto'],
- 'all_mixed': ['435.gromacs', '436.cactusADM', '454.calculix', '481.wrf'],
- 'fp': ['410.bwaves',
+                 '465.tonto'),
+ 'all_mixed': ('435.gromacs', '436.cactusADM', '454.calculix', '481.wrf'),
+ 'fp': ('410.bwaves',
         '416.gamess',
         '433.milc',
         '434.zeusmp',
@@ -100,8 +100,8 @@ benchmark_sets = \
         '465.tonto',
         '470.lbm',
         '481.wrf',
-        '482.sphinx3'],
- 'int': ['400.perlbench',
+        '482.sphinx3'),
+ 'int': ('400.perlbench',
          '401.bzip2',
          '403.gcc',
          '429.mcf',
@@ -112,4 +112,4 @@ benchmark_sets = \
          '464.h264ref',
          '471.omnetpp',
          '473.astar',
-         '483.xalancbmk']}
+         '483.xalancbmk')}
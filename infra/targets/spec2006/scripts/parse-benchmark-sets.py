@@ -40,14 +40,14 @@ if __name__ == '__main__':
     for path in glob.glob(args.specdir + '/benchspec/CPU2006/*.bset'):
         name, benchmarks = parse_setfile(path)
         benchmarks = [b for b in benchmarks if b not in args.exclude]
-        sets[name] = benchmarks
+        sets[name] = tuple(benchmarks)
 
         for bench in benchmarks:
             allbench.add(bench)
 
-    sets['all'] = sorted(allbench)
+    sets['all'] = tuple(sorted(allbench))
     for bench in allbench:
-        sets[bench] = [bench]
+        sets[bench] = (bench,)
 
     print('# this file has been generated by %s' % os.path.basename(__file__))
     print('benchmark_sets = \\')
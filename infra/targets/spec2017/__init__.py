@@ -33,8 +33,6 @@ class SPEC2017(Target):
 
     - ``--benchmarks``: alias for ``--spec2017-benchmarks``
     - ``--test``: run the test workload
-    - ``--measuremem``: use an alternative runscript that bypasses ``runspec``
-      to measure memory usage
     - ``--runspec-args``: passed directly to ``runspec``
 
     Parallel builds and runs using the ``--parallel`` option are supported.
@@ -190,7 +188,7 @@ class SPEC2017(Target):
             # make removed files writable to avoid permission errors
             srcdir = self.path(ctx, 'src')
             run(ctx, ['chmod', '-R', 'u+w', srcdir])
-            shutil.rmtree(srcdir)
+            run(ctx, ['rm', '-rf', srcdir])
 
         elif self.source_type == 'git':
             require_program(ctx, 'git')
@@ -482,12 +480,10 @@ class SPEC2017(Target):
         pass
 
     def _get_benchmarks(self, ctx, instance):
-        benchmarks = set()
-        for bset in ctx.args.benchmarks:
-            for bench in self.benchmarks[bset]:
-                if not hasattr(instance, 'exclude_spec2017_benchmark') or \
-                        not instance.exclude_spec2017_benchmark(bench):
-                    benchmarks.add(bench)
+        exclude = getattr(instance, 'exclude_spec2017_benchmark', None)
+        benchmarks = {bench for bset in ctx.args.benchmarks
+                      for bench in self.benchmarks[bset]
+                      if exclude is None or not exclude(bench)}
         return sorted(benchmarks)
 
     # define benchmark sets, generated using scripts/parse-benchmarks-sets.py
@@ -11,6 +11,7 @@ import shutil
 import argparse
 import csv
 import re
+import hashlib
 from collections import OrderedDict
 from typing import Union, List, Dict, Iterable, Optional, Callable, Any
 from urllib.request import urlretrieve
@@ -118,37 +119,58 @@ class FatalError(Exception):
     pass
 
 
-def apply_patch(ctx: Namespace, path: str, strip_count: int) -> bool:
+def apply_patch(ctx: Namespace, path: str, strip_count: int,
+                cwd: Optional[str] = None) -> bool:
     """
-    Applies a patch in the current directory by calling ``patch -p<strip_count>
-    < <path>``.
+    Applies a patch in the current directory (or in ``cwd`` if specified) by
+    calling ``patch -p<strip_count> < <path>``.
 
     Afterwards, a stamp file called ``.patched-<basename>`` is created to
     indicate that the patch has been applied. If the stamp file is already
     present, the patch is not applied at all. ``<basename>`` is generated from
-    the patch file name: ``path/to/my-patch.patch`` becomes ``my-patch``.
+    the patch file name: ``path/to/my-patch.patch`` becomes ``my-patch``. The
+    stamp file contains a SHA-256 hash of the patch, which is used to warn
+    about patches that were modified after they were applied.
 
     :param ctx: the configuration context
-    :param path: path to the patch file
+    :param path: path to the patch file, relative paths are interpreted
+                 relative to ``cwd``
     :param strip_count: number of leading elements to strip from patch paths
+    :param cwd: directory to apply the patch in, defaults to the current
+                directory
     :returns: ``True`` if the patch was applied, ``False`` if it was already
               applied before
     """
+    if cwd:
+        path = os.path.join(cwd, path)
     path = os.path.abspath(path)
     name = os.path.basename(path).replace('.patch', '')
-    stamp = '.patched-' + name
+    stamp = os.path.join(cwd or '', '.patched-' + name)
+
+    def patch_digest():
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
 
     if os.path.exists(stamp):
-        # TODO: check modification time
+        with open(stamp) as f:
+            applied_digest = f.read().strip()
+        # stamp files created by older versions are empty, and the patch file
+        # itself may have been removed since it was applied
+        if applied_digest and os.path.exists(path) and \
+                applied_digest != patch_digest():
+            ctx.log.warning('patch %s has changed since it was applied, '
+                            'the old version is still in effect' % name)
         return False
 
     ctx.log.debug('applying patch %s' % name)
     require_program(ctx, 'patch', 'required to apply source patches')
 
+    digest = patch_digest()
     with open(path) as f:
-        run(ctx, 'patch -p%d' % strip_count, stdin=f)
+        run(ctx, 'patch -p%d' % strip_count, stdin=f, cwd=cwd)
 
-    open(stamp, 'w').close()
+    with open(stamp, 'w') as f:
+        f.write(digest + '\n')
     return True
 
 
@@ -198,15 +220,16 @@ def run(ctx: Namespace, cmd: Union[str, List[str]], allow_error=False,
     stdin = kwargs.get('stdin', None)
     if isinstance(stdin, io.FileIO):
         cmd_print += ' < ' + shlex.quote(str(stdin.name))
+    workdir = kwargs.get('cwd') or os.getcwd()
     ctx.log.debug('running: %s' % cmd_print)
-    ctx.log.debug('workdir: %s' % os.getcwd())
+    ctx.log.debug('workdir: %s' % workdir)
 
     logenv = ctx.runenv.join_paths()
     logenv.update(Namespace.join_paths(env))
     renv = os.environ.copy()
     renv.update(logenv)
 
-    repro_command = 'cd \'%s\'; ' % os.getcwd()
+    repro_command = 'cd \'%s\'; ' % workdir
     for env_var, env_value in renv.items():
         # Skip this huge variable that only affects 'ls'.
         if env_var == "LS_COLORS":
@@ -236,7 +259,7 @@ def run(ctx: Namespace, cmd: Union[str, List[str]], allow_error=False,
         with redirect_stdout(ctx.runlog):
             print('-' * 80)
             print('command: %s' % cmd_print)
-            print('workdir: %s' % os.getcwd())
+            print('workdir: %s' % workdir)
             for k, v in logenv.items():
                 print('%s=%s' % (k, v))
             hdr = '-- output: '
@@ -264,7 +287,7 @@ def run(ctx: Namespace, cmd: Union[str, List[str]], allow_error=False,
     except FileNotFoundError:
         logfn = ctx.log.debug if allow_error else ctx.log.error
         logfn('command not found: %s' % cmd_print)
-        logfn('workdir:           %s' % os.getcwd())
+        logfn('workdir:           %s' % workdir)
         if allow_error:
             return
         raise
@@ -282,7 +305,7 @@ def run(ctx: Namespace, cmd: Union[str, List[str]], allow_error=False,
     if proc.returncode and not allow_error:
         ctx.log.error('command returned status %d' % proc.returncode)
         ctx.log.error('command: %s' % cmd_print)
-        ctx.log.error('workdir: %s' % os.getcwd())
+        ctx.log.error('workdir: %s' % workdir)
         for k, v in logenv.items():
             ctx.log.error('%s=%s' % (k, v))
         if proc.stdout is not None: